@@ -0,0 +1,38 @@
+"""
+Numba-compiled rolling kernels for technical metrics.
+
+pandas .rolling(...).apply(...) invokes a Python callback per window and
+is orders of magnitude slower; these keep a running sum and touch each
+element once.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def rolling_mean(x, w):
+    """Rolling mean over window w; positions before the first full
+    window are NaN"""
+    out = np.empty_like(x)
+    if x.size < w:
+        out[:] = np.nan
+        return out
+    s = 0.0
+    for i in range(w):
+        s += x[i]
+    out[:w - 1] = np.nan
+    out[w - 1] = s / w
+    for i in range(w, x.size):
+        s += x[i] - x[i - w]
+        out[i] = s / w
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def annualized_volatility(close):
+    """Annualized standard deviation of daily log returns"""
+    if close.size < 2:
+        return np.nan
+    rets = np.log(close[1:] / close[:-1])
+    return rets.std() * np.sqrt(252.0)
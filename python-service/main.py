@@ -5,21 +5,96 @@ Fixed version without proxy issues
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, EmailStr
+import httpx
+import msgspec
+import numpy as np
 import yfinance as yf
+import asyncio
+import hashlib
+import json
 import os
+import queue
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import logging
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from logging.handlers import QueueHandler, QueueListener
+
+# Configure logging - records are enqueued on the hot path and written
+# to the console by a background thread, so request handlers never block
+# on stderr I/O
+_log_queue: queue.Queue = queue.Queue(-1)
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
 logger = logging.getLogger(__name__)
 
+# Numba kernels for technical metrics - optional, metrics are simply
+# omitted when numba is not installed
+try:
+    from _numba_kernels import rolling_mean, annualized_volatility
+    _HAS_NUMBA = True
+except Exception as e:
+    logger.warning("⚠️ Numba kernels unavailable, skipping technicals: %s", e)
+    _HAS_NUMBA = False
+
+# Direct Yahoo endpoints - skips yfinance's cookie/crumb negotiation and
+# fetches only the data the service actually consumes
+YAHOO_BASE = "https://query2.finance.yahoo.com"
+_CHART_URL = YAHOO_BASE + "/v8/finance/chart/{ticker}?range={range}&interval=1d"
+_SUMMARY_URL = (
+    YAHOO_BASE + "/v10/finance/quoteSummary/{ticker}"
+    "?modules=price,summaryDetail,defaultKeyStatistics,financialData,assetProfile"
+)
+_QUOTETYPE_URL = YAHOO_BASE + "/v10/finance/quoteSummary/{ticker}?modules=quoteType"
+_YAHOO_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/118.0"
+}
+
+http_client: Optional[httpx.AsyncClient] = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the pooled HTTP client and API clients per worker, and
+    close the pool on shutdown"""
+    global http_client, anthropic_client
+    # One keep-alive pool shared by Yahoo and Anthropic traffic - saves
+    # a TLS handshake per call and multiplexes over HTTP/2
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=60.0
+    )
+    app.state.http = http_client
+    if ANTHROPIC_API_KEY:
+        try:
+            import anthropic
+            anthropic_client = anthropic.AsyncAnthropic(
+                api_key=ANTHROPIC_API_KEY,
+                max_retries=2,
+                timeout=60.0,
+                http_client=http_client
+            )
+            logger.info("✅ Anthropic client initialized successfully")
+        except Exception as e:
+            logger.error("❌ Failed to initialize Anthropic: %s", e)
+            anthropic_client = None
+    app.state.anthropic = anthropic_client
+    yield
+    await http_client.aclose()
+    _log_listener.stop()
+
+
 # Initialize FastAPI
 app = FastAPI(
     title="Sentinel AI Stock Analysis",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS
@@ -31,23 +106,89 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Anthropic client - fix for proxy issue
+# Anthropic client - created in the lifespan hook so it rides the
+# shared connection pool; fix for proxy issue
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
 anthropic_client = None
 
-if ANTHROPIC_API_KEY:
+# Redis cache - optional, falls back to a small in-process cache
+REDIS_URL = os.getenv("REDIS_URL")
+STOCK_CACHE_TTL = int(os.getenv("STOCK_CACHE_TTL", "900"))  # 15 min intraday
+redis_client = None
+
+if REDIS_URL:
     try:
-        import anthropic
-        # Create client without any proxy configuration
-        anthropic_client = anthropic.Anthropic(
-            api_key=ANTHROPIC_API_KEY,
-            max_retries=2,
-            timeout=60.0
-        )
-        logger.info("✅ Anthropic client initialized successfully")
+        import redis.asyncio as aioredis
+        redis_client = aioredis.from_url(REDIS_URL)
+        logger.info("✅ Redis cache initialized")
     except Exception as e:
-        logger.error(f"❌ Failed to initialize Anthropic: {e}")
-        anthropic_client = None
+        logger.error("❌ Failed to initialize Redis: %s", e)
+        redis_client = None
+
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", "3600"))  # 1h
+NAME_CACHE_TTL = 86400  # company names effectively never change
+
+# Fallback cache when Redis is unavailable: key -> (expires_at, value),
+# bounded LRU-style so llm:/stock:/name: entries can't grow unchecked
+LOCAL_CACHE_MAX = int(os.getenv("LOCAL_CACHE_MAX", "256"))
+_local_cache: Dict[str, Any] = {}
+
+
+def _local_cache_put(key: str, value: Any, ttl: int) -> None:
+    now = time.monotonic()
+    if len(_local_cache) >= LOCAL_CACHE_MAX:
+        # drop expired entries first, then least-recently-used
+        for k in [k for k, (exp, _) in _local_cache.items() if exp <= now]:
+            del _local_cache[k]
+        while len(_local_cache) >= LOCAL_CACHE_MAX:
+            del _local_cache[next(iter(_local_cache))]
+    _local_cache[key] = (now + ttl, value)
+
+# Cache hit/miss counters, exposed via /health
+cache_stats = {"llm_hits": 0, "llm_misses": 0}
+
+
+def metrics_fingerprint(data: "LiveData") -> str:
+    """Hash the metrics into discretized bins so near-identical inputs
+    (e.g. a price that moved a cent) share one cache entry"""
+    bucketed = {
+        k: round(v, 1) if isinstance(v, float) else v
+        for k, v in sorted(msgspec.to_builtins(data).items())
+    }
+    return hashlib.blake2b(
+        json.dumps(bucketed).encode(), digest_size=16
+    ).hexdigest()
+
+
+async def cache_get(key: str, type_: Any = Any) -> Optional[Any]:
+    """Read a cached value from Redis, or the in-process fallback"""
+    if redis_client:
+        try:
+            cached = await redis_client.get(key)
+            if cached is not None:
+                return msgspec.json.decode(cached, type=type_)
+            return None
+        except Exception as e:
+            logger.warning("⚠️ Redis get failed: %s", e)
+    entry = _local_cache.get(key)
+    if entry is not None:
+        if entry[0] > time.monotonic():
+            # re-insert so iteration order doubles as recency order
+            _local_cache[key] = _local_cache.pop(key)
+            return entry[1]
+        del _local_cache[key]
+    return None
+
+
+async def cache_set(key: str, value: Any, ttl: int) -> None:
+    """Store a value in Redis, or the in-process fallback"""
+    if redis_client:
+        try:
+            await redis_client.setex(key, ttl, msgspec.json.encode(value))
+            return
+        except Exception as e:
+            logger.warning("⚠️ Redis set failed: %s", e)
+    _local_cache_put(key, value, ttl)
 
 
 # Models
@@ -63,89 +204,391 @@ class AnalysisResponse(BaseModel):
     error: Optional[str] = None
 
 
-def fetch_stock_data(ticker: str) -> Dict[str, Any]:
-    """Fetch real-time stock data"""
+class BatchAnalysisRequest(BaseModel):
+    tickers: List[str]
+    email: EmailStr
+
+
+class BatchAnalysisResponse(BaseModel):
+    success: bool
+    reports: Dict[str, AnalysisResponse] = {}
+    error: Optional[str] = None
+
+
+async def _yahoo_json(url: str) -> Dict[str, Any]:
+    resp = await http_client.get(url, headers=_YAHOO_HEADERS, timeout=15.0)
+    resp.raise_for_status()
+    return resp.json()
+
+
+def _chart_arrays(chart: Dict[str, Any], ticker: str):
+    """Extract close/high/low/volume from a v8 chart payload as NumPy
+    arrays, dropping sessions with no close"""
+    # Yahoo answers unknown tickers with {"result": null, "error": ...}
+    results = chart.get("chart", {}).get("result")
+    if not results:
+        raise ValueError(f"No data found for {ticker}")
+    quote = results[0]["indicators"]["quote"][0]
+    close = np.array(quote["close"], dtype=float)
+    high = np.array(quote["high"], dtype=float)
+    low = np.array(quote["low"], dtype=float)
+    vol = np.array(quote["volume"], dtype=float)
+    valid = ~np.isnan(close)
+    return close[valid], high[valid], low[valid], vol[valid]
+
+
+def _flatten_quote_summary(summary: Dict[str, Any], ticker: str) -> Dict[str, Any]:
+    """Collapse quoteSummary modules into one flat dict of raw values,
+    shaped like the yfinance .info dict build_live_data expects"""
+    results = summary.get("quoteSummary", {}).get("result")
+    if not results:
+        raise ValueError(f"No data found for {ticker}")
+    info: Dict[str, Any] = {}
+    for module in results[0].values():
+        if not isinstance(module, dict):
+            continue
+        for key, value in module.items():
+            if isinstance(value, dict):
+                if "raw" in value:
+                    info.setdefault(key, value["raw"])
+            elif value is not None:
+                info.setdefault(key, value)
+    return info
+
+
+class LiveData(msgspec.Struct):
+    """Typed live-market metrics; builds and JSON-encodes much faster
+    than the Dict[str, Any] it replaces"""
+    ticker: str
+    company_name: str
+    sector: str
+    current_price: float
+    currency: str
+    market_cap: int
+    # renamed: "52_week_*" are not valid Python identifiers but stay the
+    # wire/cache key names
+    week_high_52: float = msgspec.field(name="52_week_high")
+    week_low_52: float = msgspec.field(name="52_week_low")
+    avg_volume: int
+    price_change_1d: float
+    price_change_1m: float
+    pe_ratio: Optional[float] = None
+    profit_margin: Optional[float] = None
+    roe: Optional[float] = None
+    beta: Optional[float] = None
+    sma_50: Optional[float] = None
+    sma_200: Optional[float] = None
+    volatility: Optional[float] = None
+
+
+# Numeric info fields: (LiveData field, info key, scale, default when missing)
+_METRIC_SPEC = (
+    ("pe_ratio", "trailingPE", 1, None),
+    ("profit_margin", "profitMargins", 100, None),
+    ("roe", "returnOnEquity", 100, None),
+    ("beta", "beta", 1, None),
+)
+
+
+def build_live_data(ticker: str, info: Dict[str, Any], close, high, low, vol) -> LiveData:
+    """Build the metrics struct from an info dict and OHLCV NumPy arrays"""
+    # float()/int() casts keep numpy scalars out of the JSON-bound dict;
+    # nan-aware reductions tolerate sessions with partial quote data
+    current_price = float(close[-1])
+    year_high = float(np.nanmax(high))
+    year_low = float(np.nanmin(low))
+    avg_volume = float(np.nanmean(vol))
+    price_change_1d = float(close[-1] / close[-2] - 1) * 100 if close.size > 1 else 0
+    price_change_1m = float(close[-1] / close[-22] - 1) * 100 if close.size > 21 else 0
+
+    fields = {
+        "ticker": ticker.upper(),
+        "company_name": info.get("longName", ticker),
+        "sector": info.get("sector", "Unknown"),
+        "current_price": round(current_price, 2),
+        "currency": info.get("currency", "USD"),
+        "market_cap": info.get("marketCap", 0),
+        "week_high_52": round(year_high, 2),
+        "week_low_52": round(year_low, 2),
+        "avg_volume": int(avg_volume),
+        "price_change_1d": round(price_change_1d, 2),
+        "price_change_1m": round(price_change_1m, 2),
+    }
+    # One info.get per field instead of the old
+    # "round(...) if info.get(k) else None" double lookup
+    for out_key, info_key, scale, default in _METRIC_SPEC:
+        v = info.get(info_key)
+        fields[out_key] = round(v * scale, 2) if v else default
+
+    # Technical metrics from the numba running-sum kernels - far faster
+    # than pandas rolling for the same windows
+    if _HAS_NUMBA:
+        if close.size >= 50:
+            fields["sma_50"] = round(float(rolling_mean(close, 50)[-1]), 2)
+        if close.size >= 200:
+            fields["sma_200"] = round(float(rolling_mean(close, 200)[-1]), 2)
+        if close.size >= 2:
+            fields["volatility"] = round(float(annualized_volatility(close)) * 100, 2)
+
+    return LiveData(**fields)
+
+
+# Yahoo rate-limit guards: cap concurrent upstream calls and coalesce
+# duplicate in-flight fetches for the same ticker (thundering herd)
+YAHOO_MAX_CONCURRENCY = int(os.getenv("YAHOO_MAX_CONCURRENCY", "5"))
+_yahoo_semaphore = asyncio.Semaphore(YAHOO_MAX_CONCURRENCY)
+_inflight: Dict[str, "asyncio.Future[LiveData]"] = {}
+
+
+async def _fetch_from_yahoo(ticker: str) -> LiveData:
+    """The real upstream fetch, gated by the concurrency semaphore"""
+    async with _yahoo_semaphore:
+        # Two direct async GETs in parallel - no yfinance crumb
+        # negotiation, no thread pool hop
+        chart, summary = await asyncio.gather(
+            _yahoo_json(_CHART_URL.format(ticker=ticker, range="1y")),
+            _yahoo_json(_SUMMARY_URL.format(ticker=ticker))
+        )
+
+    close, high, low, vol = _chart_arrays(chart, ticker)
+    if close.size == 0:
+        raise ValueError(f"No data found for {ticker}")
+
+    info = _flatten_quote_summary(summary, ticker)
+    return build_live_data(ticker, info, close, high, low, vol)
+
+
+async def _company_name(ticker: str) -> str:
+    """Company name via the tiny quoteType module, cached for 24h"""
+    cache_key = f"name:{ticker}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return cached
     try:
-        logger.info(f"📊 Fetching data for {ticker}")
-        stock = yf.Ticker(ticker)
-        info = stock.info
-        hist = stock.history(period="1y")
-        
-        if hist.empty:
-            raise ValueError(f"No data found for {ticker}")
-        
-        current_price = hist['Close'].iloc[-1]
-        year_high = hist['High'].max()
-        year_low = hist['Low'].min()
-        
-        data = {
-            "ticker": ticker.upper(),
-            "company_name": info.get("longName", ticker),
-            "sector": info.get("sector", "Unknown"),
-            "current_price": round(current_price, 2),
-            "currency": info.get("currency", "USD"),
-            "market_cap": info.get("marketCap", 0),
-            "pe_ratio": round(info.get("trailingPE", 0), 2) if info.get("trailingPE") else None,
-            "profit_margin": round(info.get("profitMargins", 0) * 100, 2) if info.get("profitMargins") else None,
-            "roe": round(info.get("returnOnEquity", 0) * 100, 2) if info.get("returnOnEquity") else None,
-            "52_week_high": round(year_high, 2),
-            "52_week_low": round(year_low, 2),
-            "beta": round(info.get("beta", 1), 2) if info.get("beta") else None,
-        }
-        
-        logger.info(f"✅ Data fetched successfully for {ticker}")
-        return data
-        
+        summary = await _yahoo_json(_QUOTETYPE_URL.format(ticker=ticker))
+        name = _flatten_quote_summary(summary, ticker).get("longName", ticker)
     except Exception as e:
-        logger.error(f"❌ Error fetching data: {e}")
-        raise
+        logger.warning("⚠️ Name lookup failed for %s: %s", ticker, e)
+        return ticker
+    await cache_set(cache_key, name, NAME_CACHE_TTL)
+    return name
 
 
-def generate_analysis(ticker: str, data: Dict[str, Any]) -> str:
-    """Generate AI analysis"""
-    if not anthropic_client:
-        logger.warning("⚠️ Anthropic client not available, using fallback")
-        return generate_fallback_analysis(ticker, data)
-    
+async def fetch_stock_data(ticker: str) -> LiveData:
+    """Fetch real-time stock data"""
+    cache_key = f"stock:{ticker}"
+    cached = await cache_get(cache_key, LiveData)
+    if cached is not None:
+        logger.info("⚡ Cache hit for %s", ticker)
+        return cached
+
+    # Single-flight: if this ticker is already being fetched, wait for
+    # that result instead of issuing another Yahoo request
+    fut = _inflight.get(ticker)
+    if fut is not None:
+        logger.info("⏳ Joining in-flight fetch for %s", ticker)
+        return await fut
+
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[ticker] = fut
     try:
-        logger.info(f"🧠 Generating AI analysis for {ticker}")
-        
-        prompt = f"""Analyze this stock and provide investment insights:
+        logger.info("📊 Cache miss, fetching data for %s", ticker)
+        data = await _fetch_from_yahoo(ticker)
+        fut.set_result(data)
+    except Exception as e:
+        logger.error("❌ Error fetching data: %s", e)
+        fut.set_exception(e)
+        fut.exception()  # mark retrieved in case nobody else is waiting
+        raise
+    finally:
+        # CancelledError skips the except clause above (handler tasks
+        # get cancelled on client disconnect); make sure followers are
+        # never left awaiting an unresolved future
+        if not fut.done():
+            fut.cancel()
+        _inflight.pop(ticker, None)
+
+    await cache_set(cache_key, data, STOCK_CACHE_TTL)
+    logger.info("✅ Data fetched successfully for %s", ticker)
+    return data
+
+
+YF_BATCH_SIZE = 20  # Yahoo handles up to ~20 symbols per download request
+
+
+async def fetch_stock_data_batch(tickers: List[str]) -> Dict[str, LiveData]:
+    """Fetch metrics for many tickers with one yf.download per chunk
+    instead of one history request per symbol"""
+    results: Dict[str, LiveData] = {}
+
+    # Serve what we can from the cache first
+    to_fetch = []
+    for ticker in tickers:
+        cached = await cache_get(f"stock:{ticker}", LiveData)
+        if cached is not None:
+            logger.info("⚡ Cache hit for %s", ticker)
+            results[ticker] = cached
+        else:
+            to_fetch.append(ticker)
+
+    for i in range(0, len(to_fetch), YF_BATCH_SIZE):
+        chunk = to_fetch[i:i + YF_BATCH_SIZE]
+        symbols = " ".join(chunk)
+        logger.info("📊 Batch fetching %s tickers: %s", len(chunk), symbols)
+
+        hist_all, tickers_obj = await asyncio.gather(
+            asyncio.to_thread(
+                yf.download, symbols, period="1y",
+                group_by="ticker", threads=True, progress=False,
+                auto_adjust=False, actions=False
+            ),
+            asyncio.to_thread(yf.Tickers, symbols)
+        )
+        infos = await asyncio.gather(
+            *(asyncio.to_thread(lambda t=t: tickers_obj.tickers[t].info)
+              for t in chunk),
+            return_exceptions=True
+        )
 
-{ticker} - {data.get('company_name')}
-Sector: {data.get('sector')}
-Current Price: ${data.get('current_price')}
-P/E Ratio: {data.get('pe_ratio')}
-Profit Margin: {data.get('profit_margin')}%
-ROE: {data.get('roe')}%
-52-Week Range: ${data.get('52_week_low')} - ${data.get('52_week_high')}
+        for ticker, info in zip(chunk, infos):
+            try:
+                if isinstance(info, Exception):
+                    raise info
+                # yf.download only returns a per-ticker column level
+                # when more than one symbol was requested
+                hist = hist_all[ticker] if len(chunk) > 1 else hist_all
+                hist = hist.dropna(subset=["Close"])
+                if hist.empty:
+                    raise ValueError(f"No data found for {ticker}")
+                data = build_live_data(
+                    ticker, info,
+                    hist['Close'].to_numpy(), hist['High'].to_numpy(),
+                    hist['Low'].to_numpy(), hist['Volume'].to_numpy()
+                )
+                await cache_set(f"stock:{ticker}", data, STOCK_CACHE_TTL)
+                results[ticker] = data
+            except Exception as e:
+                logger.error("❌ Batch fetch failed for %s: %s", ticker, e)
+
+    return results
+
+
+class _SafeDict(dict):
+    """format_map mapping that renders missing prompt fields as N/A"""
+    def __missing__(self, key):
+        return "N/A"
+
+
+# Compiled once at import; per-request work is a single format_map pass
+_CONTEXT_TMPL = """{ticker} - {company_name}
+Sector: {sector}
+Current Price: ${current_price}
+P/E Ratio: {pe_ratio}
+Profit Margin: {profit_margin}%
+ROE: {roe}%
+52-Week Range: ${low_52w} - ${high_52w}"""
+
+_PROMPT_TMPL = (
+    "Analyze this stock and provide investment insights:\n\n"
+    + _CONTEXT_TMPL + """
 
 Provide:
 1. Valuation Assessment
 2. Financial Health
 3. Recommendation (BUY/HOLD/SELL) with reasoning
 Keep it concise and actionable."""
+)
+
+# Independent report sections dispatched as parallel LLM calls
+_SECTION_PROMPTS = (
+    ("1. VALUATION ASSESSMENT",
+     "Assess this stock's valuation. Keep it concise and actionable."),
+    ("2. FINANCIAL HEALTH",
+     "Assess this stock's financial health. Keep it concise and actionable."),
+    ("3. RECOMMENDATION",
+     "Give a BUY/HOLD/SELL recommendation with reasoning. Keep it concise and actionable."),
+)
+
 
-        message = anthropic_client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=1500,
-            messages=[{"role": "user", "content": prompt}]
+def _prompt_mapping(ticker: str, data: LiveData) -> "_SafeDict":
+    # Round floats to one decimal and drop empty/placeholder values
+    # before templating - tokens are the cost driver here, and trailing
+    # float digits carry no signal for the model
+    compact = {
+        k: round(v, 1) if isinstance(v, float) else v
+        for k, v in msgspec.to_builtins(data).items()
+        if v not in (None, "Unknown", 0)
+    }
+    # 52_week_* keys start with a digit, which str.format can't
+    # reference, so alias them for the template
+    return _SafeDict(
+        compact,
+        ticker=ticker,
+        low_52w=compact.get("52_week_low", "N/A"),
+        high_52w=compact.get("52_week_high", "N/A"),
+    )
+
+
+def build_prompt(ticker: str, data: LiveData) -> str:
+    """Build the single-shot analysis prompt sent to Claude"""
+    return _PROMPT_TMPL.format_map(_prompt_mapping(ticker, data))
+
+
+def build_context(ticker: str, data: LiveData) -> str:
+    """Build just the metrics block shared by the section sub-prompts"""
+    return _CONTEXT_TMPL.format_map(_prompt_mapping(ticker, data))
+
+
+async def generate_analysis(ticker: str, data: LiveData) -> str:
+    """Generate AI analysis"""
+    if not anthropic_client:
+        logger.warning("⚠️ Anthropic client not available, using fallback")
+        return generate_fallback_analysis(ticker, data)
+
+    # ":sections" keeps this variant apart from the streaming path's
+    # single-shot completions, which are formatted differently
+    cache_key = f"llm:{ticker}:{metrics_fingerprint(data)}:sections"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        cache_stats["llm_hits"] += 1
+        logger.info("⚡ LLM cache hit for %s", ticker)
+        return cached
+    cache_stats["llm_misses"] += 1
+
+    try:
+        logger.info("🧠 Generating AI analysis for %s", ticker)
+
+        context = build_context(ticker, data)
+
+        # The sections are independent, so run the three shorter calls
+        # concurrently - latency is the slowest call, not the sum
+        messages = await asyncio.gather(*(
+            anthropic_client.messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=400,
+                messages=[{"role": "user", "content": f"{context}\n\n{instruction}"}]
+            )
+            for _, instruction in _SECTION_PROMPTS
+        ))
+
+        analysis = "\n\n".join(
+            f"{title}\n{message.content[0].text}"
+            for (title, _), message in zip(_SECTION_PROMPTS, messages)
         )
-        
-        analysis = message.content[0].text
-        logger.info(f"✅ AI analysis generated for {ticker}")
+        await cache_set(cache_key, analysis, LLM_CACHE_TTL)
+        logger.info("✅ AI analysis generated for %s", ticker)
         return analysis
         
     except Exception as e:
-        logger.error(f"❌ AI analysis error: {e}")
+        logger.error("❌ AI analysis error: %s", e)
         return generate_fallback_analysis(ticker, data)
 
 
-def generate_fallback_analysis(ticker: str, data: Dict[str, Any]) -> str:
+def generate_fallback_analysis(ticker: str, data: LiveData) -> str:
     """Fallback analysis when AI unavailable"""
-    pe = data.get('pe_ratio', 0)
-    margin = data.get('profit_margin', 0)
-    
+    pe = data.pe_ratio or 0
+    margin = data.profit_margin or 0
+
     recommendation = "HOLD"
     if pe and pe < 20 and margin and margin > 15:
         recommendation = "BUY"
@@ -154,7 +597,7 @@ def generate_fallback_analysis(ticker: str, data: Dict[str, Any]) -> str:
     
     return f"""ANALYSIS FOR {ticker}
 
-Current Price: ${data.get('current_price')}
+Current Price: ${data.current_price}
 P/E Ratio: {pe} - {"Attractive" if pe and pe < 25 else "Premium"} valuation
 Profit Margin: {margin}% - {"Strong" if margin and margin > 15 else "Moderate"} profitability
 
@@ -179,7 +622,8 @@ async def health():
     return {
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
-        "ai_available": bool(anthropic_client)
+        "ai_available": bool(anthropic_client),
+        "cache_stats": cache_stats
     }
 
 
@@ -188,45 +632,131 @@ async def generate_report(request: AnalysisRequest):
     """Generate stock analysis report"""
     try:
         ticker = request.company_name.strip().upper()
-        logger.info(f"📊 Analysis request for {ticker} from {request.email}")
+        logger.info("📊 Analysis request for %s from %s", ticker, request.email)
         
         # Fetch data
-        live_data = fetch_stock_data(ticker)
+        live_data = await fetch_stock_data(ticker)
         
         # Generate analysis
-        report = generate_analysis(ticker, live_data)
+        report = await generate_analysis(ticker, live_data)
         
-        logger.info(f"✅ Analysis complete for {ticker}")
+        logger.info("✅ Analysis complete for %s", ticker)
         
         return AnalysisResponse(
             success=True,
-            live_data=live_data,
+            live_data=msgspec.to_builtins(live_data),
             report=report
         )
         
     except Exception as e:
-        logger.error(f"❌ Analysis failed: {str(e)}")
+        logger.error("❌ Analysis failed: %s", e)
         return AnalysisResponse(
             success=False,
             error=str(e)
         )
 
 
+@app.post("/api/generate-report/stream")
+async def generate_report_stream(request: AnalysisRequest):
+    """Stream the analysis as Server-Sent Events: live_data as the first
+    event, then report text deltas as Claude produces them"""
+    ticker = request.company_name.strip().upper()
+    logger.info("📊 Streaming analysis request for %s from %s", ticker, request.email)
+
+    async def event_stream():
+        try:
+            live_data = await fetch_stock_data(ticker)
+        except Exception as e:
+            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            return
+
+        yield f"data: {json.dumps({'live_data': msgspec.to_builtins(live_data)})}\n\n"
+
+        if not anthropic_client:
+            fallback = generate_fallback_analysis(ticker, live_data)
+            yield f"data: {json.dumps({'delta': fallback})}\n\n"
+            yield "data: [DONE]\n\n"
+            return
+
+        cache_key = f"llm:{ticker}:{metrics_fingerprint(live_data)}:single"
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            cache_stats["llm_hits"] += 1
+            yield f"data: {json.dumps({'delta': cached})}\n\n"
+            yield "data: [DONE]\n\n"
+            return
+        cache_stats["llm_misses"] += 1
+
+        try:
+            parts = []
+            async with anthropic_client.messages.stream(
+                model="claude-sonnet-4-20250514",
+                max_tokens=1200,
+                messages=[{"role": "user", "content": build_prompt(ticker, live_data)}]
+            ) as stream:
+                async for text in stream.text_stream:
+                    parts.append(text)
+                    yield f"data: {json.dumps({'delta': text})}\n\n"
+            await cache_set(cache_key, "".join(parts), LLM_CACHE_TTL)
+        except Exception as e:
+            logger.error("❌ Streaming analysis error: %s", e)
+            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            return
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+@app.post("/api/generate-reports", response_model=BatchAnalysisResponse)
+async def generate_reports(request: BatchAnalysisRequest):
+    """Generate analysis reports for a batch of tickers"""
+    try:
+        tickers = [t.strip().upper() for t in request.tickers if t.strip()]
+        if not tickers:
+            return BatchAnalysisResponse(success=False, error="No tickers provided")
+        logger.info("📊 Batch analysis request for %s tickers from %s", len(tickers), request.email)
+
+        all_data = await fetch_stock_data_batch(tickers)
+
+        reports: Dict[str, AnalysisResponse] = {}
+        for ticker in tickers:
+            live_data = all_data.get(ticker)
+            if live_data is None:
+                reports[ticker] = AnalysisResponse(
+                    success=False, error=f"No data found for {ticker}")
+                continue
+            report = await generate_analysis(ticker, live_data)
+            reports[ticker] = AnalysisResponse(
+                success=True, live_data=msgspec.to_builtins(live_data),
+                report=report)
+
+        logger.info("✅ Batch analysis complete for %s tickers", len(tickers))
+        return BatchAnalysisResponse(success=True, reports=reports)
+
+    except Exception as e:
+        logger.error("❌ Batch analysis failed: %s", e)
+        return BatchAnalysisResponse(success=False, error=str(e))
+
+
 @app.get("/api/verify-price/{ticker}")
 async def verify_price(ticker: str):
     """Quick price verification"""
     try:
-        stock = yf.Ticker(ticker)
-        hist = stock.history(period="1d")
-        info = stock.info
-        
-        if hist.empty:
+        # The chart endpoint alone answers this; the old .info call was
+        # the expensive, rate-limited part of the request
+        chart, name = await asyncio.gather(
+            _yahoo_json(_CHART_URL.format(ticker=ticker, range="1d")),
+            _company_name(ticker)
+        )
+
+        close, _, _, _ = _chart_arrays(chart, ticker)
+        if close.size == 0:
             return {"error": "Invalid ticker", "valid": False}
-        
+
         return {
             "ticker": ticker.upper(),
-            "price": round(hist['Close'].iloc[-1], 2),
-            "company": info.get("longName", ticker),
+            "price": round(float(close[-1]), 2),
+            "company": name,
             "valid": True
         }
     except Exception as e:
@@ -236,4 +766,13 @@ async def verify_price(ticker: str):
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # uvloop + httptools (from uvicorn[standard]) and one worker per core;
+    # each worker process imports this module and gets its own clients
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 2))
+    )